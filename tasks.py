@@ -0,0 +1,135 @@
+# Task lists, the lookups derived from them, and the per-size page CSS.
+# Streamlit re-executes app.py on every rerun, but an imported module like this
+# one is evaluated once per process, so constants and lookups belong here.
+
+# -----------------------------
+# Task lists (your exact list, with 'surfaces' typo fixed)
+# -----------------------------
+DAILY_TASKS = [
+    "Open windows 10–15 min; Wipe surfaces/Remove dust/tidy up/Remove fur with glove on sofas, chairs, curtain bottoms silently",
+    "Rinse/wash dishes after meals; dry and clean sink before bedtime",
+    "Wipe dining table & kitchen counters after each meal",
+    "Sweep or spot-vacuum crumbs in living room/kitchen",
+    "Hoover or run robot (avoid baby nap); quick fur spots",
+    "Clean toilets (seat, bowl, rim) + sink; quick shower rinse",
+    "Litter room: check 2–3×; sweep spills; wipe majla if dirty (use gloves and wash hands always afterwards)",
+    "Wipe stovetop after use; degrease backsplash if splashed",
+    "Take out kitchen & litter trash ( wash hands afterwards); replace bags",
+    "Laundry – sort colors & load machine in the morning",
+    "Laundry – fold same day and put away neatly",
+    "Wash water pet bowl; refresh water AM/PM",
+    "Laundry – iron shirts/pants as needed",
+]
+
+EVERY2_TASKS = [
+    "Mop all floors — separate mop (litter room vs house)",
+    "Wipe lower window panes & sills throughout the house",
+]
+EVERY2_DAYS = frozenset({"Wednesday", "Friday", "Sunday"})
+
+WEEKLY_TASKS_THU = [
+    "Litter tray: empty, wash, refill; scrub surrounding floor",
+    "Pantry quick tidy + expiry scan",
+    "Squeegee shower tiles after last shower",
+    "Mirrors & glass doors",
+    "Clean house entry area",
+    "Refill Soap",
+]
+WEEKLY_TASKS_SAT = [
+    "Oven: remove trays; clean inside, door glass, upper parts",
+    "Microwave: clean inside; wipe handle/exterior",
+    "Fridge: wipe exterior & handles; spot-clean shelves (spills)",
+    "Terrace clean: clean furniture; wash floor; wipe railing",
+    "Disinfect doors, handles, and light switches",
+]
+
+DAYS = ["Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
+ALL_TASKS = DAILY_TASKS + EVERY2_TASKS + WEEKLY_TASKS_THU + WEEKLY_TASKS_SAT
+
+class _SlugTable(dict):
+    # str.translate table: lowercase alphanumerics, everything else -> "-".
+    # Filled lazily so non-ASCII characters (e.g. "–", "×") map exactly like str.isalnum says.
+    # Defined here rather than in app.py, so the filled table survives reruns.
+    def __missing__(self, code: int) -> str:
+        ch = chr(code)
+        self[code] = ch.lower() if ch.isalnum() else "-"
+        return self[code]
+
+_SLUG_TABLE = _SlugTable()
+
+def _make_slug(day: str, task: str) -> str:
+    return f"{day}::{task}".translate(_SLUG_TABLE)[:200]
+
+# Widget keys are fixed by the lists above, so build them once per process
+# (this module is imported once) instead of on every rerun.
+SLUGS = {(d, t): _make_slug(d, t) for d in DAYS for t in ALL_TASKS}
+
+def slug(day: str, task: str) -> str:
+    return SLUGS[(day, task)]
+
+def _build_groups(day: str):
+    groups = [("DAILY TASKS", tuple(DAILY_TASKS))]
+    if day in EVERY2_DAYS:
+        groups.append(("EVERY 2 DAYS", tuple(EVERY2_TASKS)))
+    if day == "Thursday":
+        groups.append(("WEEKLY TASKS", tuple(WEEKLY_TASKS_THU)))
+    if day == "Saturday":
+        groups.append(("WEEKLY TASKS", tuple(WEEKLY_TASKS_SAT)))
+    return tuple(groups)
+
+# The schedule only depends on the day, so resolve it (and the widget keys) once per process
+DAY_GROUPS = {d: _build_groups(d) for d in DAYS}
+DAY_KEYS = {d: tuple(slug(d, t) for _, items in DAY_GROUPS[d] for t in items) for d in DAYS}
+
+def tasks_for_day(day: str):
+    return DAY_GROUPS[day]
+
+# Map sizes to CSS vars
+size_map = {
+    "Normal": {"base": 17, "check": 18, "radio": 16, "scale": 1.00},
+    "Large": {"base": 19, "check": 20, "radio": 18, "scale": 1.12},
+    "Extra Large": {"base": 21, "check": 22, "radio": 20, "scale": 1.25},
+}
+
+# Mobile-friendly CSS for readability
+def _css(S: dict) -> str:
+    return f"""
+    <style>
+    html, body, .block-container {{ font-size: {S['base']}px; }}
+    .block-container {{ padding-top: 0.5rem; padding-bottom: 2rem; }}
+
+    /* Day picker: horizontal pills + larger text */
+    div[role="radiogroup"] {{
+      display: flex !important;
+      gap: 8px;
+      overflow-x: auto;
+      white-space: nowrap;
+      padding: 0.25rem 0 0.5rem 0;
+    }}
+    div[role="radiogroup"] > label {{
+      border: 1px solid #e6e6e6 !important;
+      border-radius: 999px !important;
+      padding: 0.45rem 0.9rem !important;
+      margin: 0 !important;
+      background: #fafafa;
+      font-size: {S['radio']}px !important;
+    }}
+
+    /* Bigger checkbox labels + comfy line height */
+    div[data-testid="stCheckbox"] label {{
+      font-size: {S['check']}px !important;
+      line-height: 1.5 !important;
+    }}
+    /* Slightly enlarge the checkbox hit area */
+    div[data-testid="stCheckbox"] input {{
+      transform: scale({S['scale']});
+      margin-right: 6px;
+    }}
+
+    /* Make section headers stand out a bit more on mobile */
+    h3, h2 {{ margin-top: 0.8rem; }}
+    </style>
+    """
+
+# Only three variants; formatted once per process when this module is imported
+CSS_BY_SIZE = {name: _css(S) for name, S in size_map.items()}